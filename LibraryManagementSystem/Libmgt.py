@@ -1,5 +1,49 @@
+import atexit
+import collections
+import csv
+import queue
 import sqlite3
+import sys
 import os
+from contextlib import contextmanager
+
+# The schema is fixed, so the hot-path SQL is generated exactly once at
+# module load from a single column tuple: tweak COLUMNS and every statement
+# follows. sys.intern guarantees each execute() call passes the identical
+# string object, so the connection's statement cache hits on identity.
+COLUMNS = ("title", "author", "isbn")
+_COLS = ", ".join(COLUMNS)
+_PLACEHOLDERS = ", ".join("?" * len(COLUMNS))
+_ALL_COLS = ", ".join(("id",) + COLUMNS + ("status",))
+
+SQL_INSERT_BOOK = sys.intern(
+    f"INSERT INTO books ({_COLS}) VALUES ({_PLACEHOLDERS})")
+SQL_INSERT_OR_IGNORE = sys.intern(
+    f"INSERT OR IGNORE INTO books ({_COLS}) VALUES ({_PLACEHOLDERS})")
+SQL_SELECT_ALL = sys.intern(
+    f"SELECT {_ALL_COLS} FROM books ORDER BY title")
+SQL_SEARCH_FTS = sys.intern(f"""
+SELECT {_ALL_COLS} FROM books
+WHERE id IN (SELECT rowid FROM books_fts WHERE books_fts MATCH ?)
+ORDER BY title
+""")
+SQL_SEARCH_LIKE = sys.intern(f"""
+SELECT {_ALL_COLS} FROM books
+WHERE title LIKE ? COLLATE NOCASE OR author LIKE ? COLLATE NOCASE OR isbn = ?
+ORDER BY title
+""")
+SQL_UPDATE_STATUS = sys.intern("UPDATE books SET status = ? WHERE id = ?")
+SQL_LOAN = sys.intern("UPDATE books SET status = 'Loaned' WHERE id = ? AND status = 'Available'")
+SQL_RETURN = sys.intern("UPDATE books SET status = 'Available' WHERE id = ? AND status = 'Loaned'")
+SQL_SELECT_STATUS = sys.intern("SELECT title, status FROM books WHERE id = ?")
+SQL_DELETE = sys.intern("DELETE FROM books WHERE id = ?")
+
+# Sentinel cache key for the view-all result (no search term can collide with it)
+_ALL_BOOKS_KEY = object()
+
+# Bumped when the CREATE TABLE shape changes; stored in PRAGMA user_version
+# so existing databases are migrated at most once.
+_SCHEMA_VERSION = 1
 
 class LibraryDBManager:
     """
@@ -7,24 +51,87 @@ class LibraryDBManager:
     Uses SQLite3, which creates a file-based database.
     """
 
+    _SEARCH_CACHE_MAX = 64
+
+    # One instance per database file; repeated instantiations in a
+    # long-lived application reuse the open connections instead of paying
+    # for file opens, WAL shm setup, and the schema probe every time.
+    _instances = {}
+
+    def __new__(cls, db_name="library.db"):
+        return cls._instances.setdefault(db_name, super().__new__(cls))
+
     def __init__(self, db_name="library.db"):
         """Initializes the database connection and creates the 'books' table."""
+        if getattr(self, "_initialized", False):
+            return
         self.db_name = db_name
         self.conn = None
         self.cursor = None
-        self._connect()
-        self._create_table()
+        # Assume no FTS until _create_fts_table proves otherwise, so a schema
+        # setup that errors out degrades to the LIKE search path instead of
+        # leaving the attribute unset.
+        self._fts_enabled = False
+        # Bounded LRU cache for repeated search/view queries, invalidated on
+        # any write so stale results are never served.
+        self._search_cache = collections.OrderedDict()
+        try:
+            self._connect()
+            self._create_table()
+            self._open_reader_pool()
+        except Exception:
+            # Never cache a half-built instance; the next instantiation
+            # must retry from scratch instead of receiving this one.
+            self._instances.pop(db_name, None)
+            raise
+        # Pick the fastest available search path once at startup instead of
+        # branching on FTS availability inside every search call.
+        self.search_book = self._search_fts if self._fts_enabled else self._search_like
+        # __del__ runs unreliably at interpreter shutdown; an atexit hook
+        # guarantees the connections are closed exactly once.
+        atexit.register(self.close)
+        self._initialized = True
 
     def _connect(self):
-        """Establishes the connection to the SQLite database file."""
+        """
+        Establishes the connection to the SQLite database file.
+
+        The connection is tuned for performance: WAL journaling lets readers
+        proceed while a writer commits, and synchronous=NORMAL cuts the
+        per-commit fsync cost. Note that WAL mode creates '-wal' and '-shm'
+        sidecar files next to the database file.
+        """
         try:
             # Check if the database file already exists
             db_exists = os.path.exists(self.db_name)
-            
-            # Connect to the database file
-            self.conn = sqlite3.connect(self.db_name)
+
+            # Connect to the database file; a larger statement cache keeps
+            # all of our prepared statements resident between calls.
+            # isolation_level=None puts the connection in autocommit mode so
+            # transactions are controlled explicitly ('with self.conn:' around
+            # writes) instead of by the module's implicit-BEGIN heuristics.
+            self.conn = sqlite3.connect(self.db_name, isolation_level=None,
+                                        cached_statements=256)
+            # sqlite3.Row gives C-speed access by both index and column name,
+            # so callers can read book['title'] without positional unpacking
+            # and new columns never break existing consumers.
+            self.conn.row_factory = sqlite3.Row
             self.cursor = self.conn.cursor()
-            
+
+            # Apply performance PRAGMAs. WAL may be unavailable on some
+            # filesystems (e.g. network mounts); fall back to the default
+            # DELETE journal in that case.
+            try:
+                self.cursor.executescript("""
+                    PRAGMA journal_mode=WAL;
+                    PRAGMA synchronous=NORMAL;
+                    PRAGMA temp_store=MEMORY;
+                    PRAGMA cache_size=-64000;
+                    PRAGMA mmap_size=268435456;
+                """)
+            except sqlite3.OperationalError:
+                self.cursor.execute("PRAGMA journal_mode=DELETE")
+
             if not db_exists:
                 print(f"Database '{self.db_name}' created successfully.")
 
@@ -36,63 +143,312 @@ class LibraryDBManager:
         sql_create_table = """
         CREATE TABLE IF NOT EXISTS books (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            author TEXT NOT NULL,
+            title TEXT NOT NULL COLLATE NOCASE,
+            author TEXT NOT NULL COLLATE NOCASE,
             isbn TEXT UNIQUE NOT NULL,
             status TEXT NOT NULL DEFAULT 'Available'
         );
         """
         try:
             self.cursor.execute(sql_create_table)
-            self.conn.commit()
+            self._migrate_schema()
+            # Indexes for the hot paths: the title index serves ORDER BY title
+            # and prefix LIKE searches without a sort, the ISBN index serves
+            # the exact-ISBN search branch. ANALYZE gives the query planner
+            # fresh statistics so it actually picks them.
+            self.cursor.executescript("""
+                CREATE INDEX IF NOT EXISTS idx_books_title ON books(title COLLATE NOCASE);
+                CREATE INDEX IF NOT EXISTS idx_books_isbn ON books(isbn);
+                ANALYZE;
+            """)
+            self._create_fts_table()
             print("[DB Ready] Table 'books' checked/created.")
         except sqlite3.Error as e:
             print(f"Error creating table: {e}")
 
+    def _migrate_schema(self):
+        """
+        Upgrades databases created before title/author carried COLLATE NOCASE.
+
+        With matching collations the title index serves ORDER BY title
+        directly, so SQLite skips the temp B-tree sort. ALTER TABLE cannot
+        change a column's collation, so old databases are rebuilt once: rows
+        are copied into a new NOCASE table which is then swapped in.
+        """
+        version = self.cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
+        row = self.cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='books'").fetchone()
+        if row and 'NOCASE' not in row[0]:
+            self.cursor.executescript("""
+                BEGIN;
+                CREATE TABLE books_new (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL COLLATE NOCASE,
+                    author TEXT NOT NULL COLLATE NOCASE,
+                    isbn TEXT UNIQUE NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'Available'
+                );
+                INSERT INTO books_new SELECT id, title, author, isbn, status FROM books;
+                DROP TABLE books;
+                ALTER TABLE books_new RENAME TO books;
+                COMMIT;
+            """)
+        self.cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def _create_fts_table(self):
+        """
+        Creates an FTS5 full-text index over the 'books' table.
+
+        Searching through the FTS index is O(log N + matches) instead of the
+        O(N) full scan a LIKE query needs, and FTS handles case-folding
+        natively. Triggers keep the index in sync with the 'books' table.
+        Sets self._fts_enabled; search_book falls back to LIKE when the
+        linked SQLite was built without FTS5.
+        """
+        self._fts_enabled = False
+        if not self._fts5_supported():
+            # Drop any sync triggers left behind by an FTS5-capable build;
+            # they reference the fts5 module, so keeping them would make
+            # every write to 'books' fail with "no such module: fts5".
+            self.cursor.executescript("""
+                DROP TRIGGER IF EXISTS books_fts_insert;
+                DROP TRIGGER IF EXISTS books_fts_delete;
+                DROP TRIGGER IF EXISTS books_fts_update;
+            """)
+            return
+        self.cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='books_fts'")
+        fts_existed = self.cursor.fetchone() is not None
+        try:
+            self.cursor.executescript("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5(
+                    title, author, isbn,
+                    content='books', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                );
+                CREATE TRIGGER IF NOT EXISTS books_fts_insert AFTER INSERT ON books BEGIN
+                    INSERT INTO books_fts(rowid, title, author, isbn)
+                    VALUES (new.id, new.title, new.author, new.isbn);
+                END;
+                CREATE TRIGGER IF NOT EXISTS books_fts_delete AFTER DELETE ON books BEGIN
+                    INSERT INTO books_fts(books_fts, rowid, title, author, isbn)
+                    VALUES ('delete', old.id, old.title, old.author, old.isbn);
+                END;
+                CREATE TRIGGER IF NOT EXISTS books_fts_update AFTER UPDATE ON books BEGIN
+                    INSERT INTO books_fts(books_fts, rowid, title, author, isbn)
+                    VALUES ('delete', old.id, old.title, old.author, old.isbn);
+                    INSERT INTO books_fts(rowid, title, author, isbn)
+                    VALUES (new.id, new.title, new.author, new.isbn);
+                END;
+            """)
+            if not fts_existed:
+                # Index any rows that were added before the FTS table existed
+                self.cursor.execute("INSERT INTO books_fts(books_fts) VALUES('rebuild')")
+            self._fts_enabled = True
+        except sqlite3.OperationalError:
+            # FTS5 advertised but unusable (e.g. missing tokenizer); use LIKE
+            pass
+
+    def _fts5_supported(self):
+        """Checks whether the linked SQLite library was compiled with FTS5."""
+        try:
+            row = self.cursor.execute(
+                "SELECT sqlite_compileoption_used('ENABLE_FTS5')").fetchone()
+            return bool(row and row[0])
+        except sqlite3.Error:
+            return False
+
+    def _open_reader_pool(self):
+        """
+        Opens a small pool of read-only connections for the query methods.
+
+        Under WAL, readers never block the writer (and vice versa), so when
+        this class is embedded in a multi-threaded front-end the viewers can
+        run SELECTs in parallel instead of serializing on the single writer
+        connection. Write methods keep using self.conn exclusively.
+        """
+        self._readers = queue.Queue()
+        self._pool_size = 0
+        try:
+            for _ in range(os.cpu_count() or 2):
+                conn = sqlite3.connect(f"file:{self.db_name}?mode=ro", uri=True,
+                                       cached_statements=256, check_same_thread=False)
+                conn.row_factory = sqlite3.Row
+                self._readers.put(conn)
+                self._pool_size += 1
+        except sqlite3.Error:
+            # Read-only URI opens can fail on some builds/filesystems; the
+            # query methods then fall back to the writer connection.
+            while not self._readers.empty():
+                self._readers.get().close()
+            self._pool_size = 0
+
+    def _cache_get(self, key):
+        """Returns the cached rows for key (marking it most-recent), or None."""
+        rows = self._search_cache.get(key)
+        if rows is not None:
+            self._search_cache.move_to_end(key)
+        return rows
+
+    def _cache_put(self, key, rows):
+        """Stores rows under key, evicting the least-recently-used entry if full."""
+        self._search_cache[key] = rows
+        self._search_cache.move_to_end(key)
+        if len(self._search_cache) > self._SEARCH_CACHE_MAX:
+            self._search_cache.popitem(last=False)
+
+    @contextmanager
+    def _read_conn(self):
+        """Borrows a read-only connection from the pool (blocking if all are in use)."""
+        if self._pool_size == 0:
+            yield self.conn
+            return
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
     def add_book(self, title, author, isbn):
         """Inserts a new book record into the database."""
-        sql_insert = "INSERT INTO books (title, author, isbn) VALUES (?, ?, ?)"
         try:
-            self.cursor.execute(sql_insert, (title, author, isbn))
-            self.conn.commit()
-            print(f"\n[SUCCESS] Book '{title}' added successfully.")
-        except sqlite3.IntegrityError:
-            # IntegrityError occurs if the ISBN already exists (UNIQUE constraint)
-            print(f"\n[ERROR] A book with ISBN {isbn} already exists.")
+            if self.add_books([(title, author, isbn)]) > 0:
+                print(f"\n[SUCCESS] Book '{title}' added successfully.")
+            else:
+                # A row is skipped only if the ISBN already exists (UNIQUE constraint)
+                print(f"\n[ERROR] A book with ISBN {isbn} already exists.")
         except sqlite3.Error as e:
             print(f"\n[ERROR] Error adding book: {e}")
 
-    def view_all_books(self):
-        """Fetches and returns all books in the database."""
-        sql_select_all = "SELECT id, title, author, isbn, status FROM books ORDER BY title"
+    def add_books(self, rows):
+        """
+        Inserts many (title, author, isbn) rows in a single transaction.
+
+        Committing once for the whole batch avoids one fsync per row, and
+        INSERT OR IGNORE lets SQLite skip duplicate ISBNs internally instead
+        of raising per-row IntegrityErrors, so the bulk path never pays for
+        Python exception unwinding. Returns the number of rows inserted;
+        the duplicate count is len(rows) minus that.
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+        self._search_cache.clear()
+        with self.conn:
+            # The connection is in autocommit mode, so open the batch
+            # transaction explicitly; the context manager then issues the
+            # single COMMIT (or ROLLBACK on error) for the whole batch.
+            self.conn.execute("BEGIN")
+            cursor = self.conn.executemany(SQL_INSERT_OR_IGNORE, rows)
+        return cursor.rowcount
+
+    def bulk_import(self, rows):
+        """
+        Imports a large batch of rows with index maintenance deferred.
+
+        Dropping the title index and the FTS sync triggers for the duration
+        of the load means each INSERT no longer rebalances the B-tree or
+        updates the full-text index row by row; both are rebuilt once after
+        the load, which roughly halves total insert time on large imports.
+        Returns the number of rows inserted, or None if the import failed,
+        so callers can tell a failed import from an all-duplicates batch.
+        """
         try:
-            self.cursor.execute(sql_select_all)
-            # fetchall() retrieves all rows as a list of tuples
-            return self.cursor.fetchall()
+            self.cursor.execute("DROP INDEX IF EXISTS idx_books_title")
+            if self._fts_enabled:
+                self.cursor.executescript("""
+                    DROP TRIGGER IF EXISTS books_fts_insert;
+                    DROP TRIGGER IF EXISTS books_fts_delete;
+                    DROP TRIGGER IF EXISTS books_fts_update;
+                """)
+            try:
+                added = self.add_books(rows)
+            finally:
+                self.cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_books_title ON books(title COLLATE NOCASE)")
+                if self._fts_enabled:
+                    # Recreate the triggers, then rebuild the FTS index in one
+                    # pass to pick up the rows inserted while they were off.
+                    self._create_fts_table()
+                    self.cursor.execute("INSERT INTO books_fts(books_fts) VALUES('rebuild')")
+                self.conn.execute("ANALYZE")
+            return added
         except sqlite3.Error as e:
-            print(f"\n[ERROR] Error viewing books: {e}")
-            return []
+            print(f"\n[ERROR] Error importing books: {e}")
+            return None
 
-    # --- NEW METHOD: Search Book ---
-    def search_book(self, search_term):
-        """
-        Searches for books where the title, author, or ISBN contains the search term.
-        Search is case-insensitive (using LOWER()).
+    def iter_all_books(self):
         """
-        # The LIKE operator is used for pattern matching. 
-        # The '%' wildcard matches any sequence of zero or more characters.
-        sql_search = """
-        SELECT id, title, author, isbn, status FROM books 
-        WHERE LOWER(title) LIKE ? OR LOWER(author) LIKE ? OR isbn LIKE ?
-        ORDER BY title
+        Yields all books in the database one row at a time.
+
+        Streaming rows instead of fetchall() keeps memory constant for large
+        libraries and lets the caller print the first row immediately instead
+        of waiting for the whole result set to materialize.
         """
-        # Prepare the search terms for the LIKE operator
-        term = '%' + search_term.lower() + '%'
-        
+        cached = self._cache_get(_ALL_BOOKS_KEY)
+        if cached is not None:
+            yield from cached
+            return
+        rows = []
+        try:
+            with self._read_conn() as conn:
+                cursor = conn.execute(SQL_SELECT_ALL)
+                # Batch the C-level fetch so streaming stays cheap
+                cursor.arraysize = 200
+                for row in cursor:
+                    rows.append(row)
+                    yield row
+        except sqlite3.Error as e:
+            print(f"\n[ERROR] Error viewing books: {e}")
+            return
+        # Only reached when the caller consumed every row, so the cached
+        # result is complete.
+        self._cache_put(_ALL_BOOKS_KEY, rows)
+
+    # --- Search Book ---
+    # search_book is bound in __init__ to whichever implementation matches
+    # the SQLite build; both search title, author, and ISBN case-insensitively
+    # and serve repeated terms from the LRU cache.
+
+    def _search_fts(self, search_term):
+        """Searches for books via the FTS5 index (O(log N + matches))."""
+        cache_key = search_term.lower().strip()
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        try:
+            with self._read_conn() as conn:
+                # Quote the term (doubling any embedded quotes) so FTS treats
+                # it as a literal phrase, and add '*' for prefix matching.
+                fts_term = '"{}"*'.format(search_term.replace('"', '""'))
+                results = conn.execute(SQL_SEARCH_FTS, (fts_term,)).fetchall()
+            self._cache_put(cache_key, results)
+            return results
+        except sqlite3.Error as e:
+            print(f"\n[ERROR] Error searching books: {e}")
+            return []
+
+    def _search_like(self, search_term):
+        """Searches for books via indexed LIKE, for builds without FTS5."""
+        cache_key = search_term.lower().strip()
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
         try:
-            # Pass the search term three times for the three placeholders (?, ?, ?)
-            self.cursor.execute(sql_search, (term, term, term.replace('%', ''))) # ISBN is exact if no wildcard
-            return self.cursor.fetchall()
+            with self._read_conn() as conn:
+                # COLLATE NOCASE handles case-folding at the index level, so
+                # prefix searches can use idx_books_title instead of a scan.
+                # The ISBN branch uses equality rather than LIKE, so '%'/'_'
+                # in the term are never treated as wildcards and the lookup
+                # is an index probe on idx_books_isbn.
+                like_term = f"%{search_term}%"
+                isbn_term = search_term.strip()
+                results = conn.execute(SQL_SEARCH_LIKE,
+                                       (like_term, like_term, isbn_term)).fetchall()
+            self._cache_put(cache_key, results)
+            return results
         except sqlite3.Error as e:
             print(f"\n[ERROR] Error searching books: {e}")
             return []
@@ -100,10 +456,10 @@ class LibraryDBManager:
 
     def update_book_status(self, book_id, new_status):
         """Updates the status of a specific book (e.g., 'Loaned' or 'Available')."""
-        sql_update = "UPDATE books SET status = ? WHERE id = ?"
         try:
-            self.cursor.execute(sql_update, (new_status, book_id))
-            self.conn.commit()
+            with self.conn:
+                self.cursor.execute(SQL_UPDATE_STATUS, (new_status, book_id))
+            self._search_cache.clear()
             
             if self.cursor.rowcount > 0:
                 print(f"\n[SUCCESS] Book ID {book_id} status updated to '{new_status}'.")
@@ -117,48 +473,56 @@ class LibraryDBManager:
 
     def loan_book(self, book_id):
         """Loans a book if it is currently 'Available'."""
-        # 1. Check current status
-        self.cursor.execute("SELECT title, status FROM books WHERE id = ?", (book_id,))
+        # A single conditional UPDATE both checks and changes the status, so
+        # there is no SELECT-then-UPDATE race and only one statement on the
+        # success path; rowcount tells us whether the book was loaned.
+        with self.conn:
+            self.cursor.execute(SQL_LOAN, (book_id,))
+        self._search_cache.clear()
+
+        if self.cursor.rowcount > 0:
+            print(f"\n[SUCCESS] Book ID {book_id} status updated to 'Loaned'.")
+            return
+
+        # The UPDATE matched nothing; a follow-up SELECT (only on this cold
+        # path) distinguishes "not found" from "already loaned".
+        self.cursor.execute(SQL_SELECT_STATUS, (book_id,))
         result = self.cursor.fetchone()
-        
         if result is None:
             print(f"\n[FAILURE] Loan failed: Book ID {book_id} not found.")
-            return
-
-        title, current_status = result
-        if current_status == 'Loaned':
-            print(f"\n[FAILURE] '{title}' (ID {book_id}) is already loaned.")
-        elif current_status == 'Available':
-            self.update_book_status(book_id, 'Loaned')
+        elif result['status'] == 'Loaned':
+            print(f"\n[FAILURE] '{result['title']}' (ID {book_id}) is already loaned.")
         else:
             print("\n[ERROR] Invalid book status encountered.")
 
 
     def return_book(self, book_id):
         """Marks a book as 'Available' if it is currently 'Loaned'."""
-        # 1. Check current status
-        self.cursor.execute("SELECT title, status FROM books WHERE id = ?", (book_id,))
+        # Same atomic conditional-UPDATE pattern as loan_book.
+        with self.conn:
+            self.cursor.execute(SQL_RETURN, (book_id,))
+        self._search_cache.clear()
+
+        if self.cursor.rowcount > 0:
+            print(f"\n[SUCCESS] Book ID {book_id} status updated to 'Available'.")
+            return
+
+        self.cursor.execute(SQL_SELECT_STATUS, (book_id,))
         result = self.cursor.fetchone()
-        
         if result is None:
             print(f"\n[FAILURE] Return failed: Book ID {book_id} not found.")
-            return
-
-        title, current_status = result
-        if current_status == 'Available':
-            print(f"\n[FAILURE] '{title}' (ID {book_id}) is already available.")
-        elif current_status == 'Loaned':
-            self.update_book_status(book_id, 'Available')
+        elif result['status'] == 'Available':
+            print(f"\n[FAILURE] '{result['title']}' (ID {book_id}) is already available.")
         else:
             print("\n[ERROR] Invalid book status encountered.")
 
 
     def delete_book(self, book_id):
         """Deletes a book record by its ID."""
-        sql_delete = "DELETE FROM books WHERE id = ?"
         try:
-            self.cursor.execute(sql_delete, (book_id,))
-            self.conn.commit()
+            with self.conn:
+                self.cursor.execute(SQL_DELETE, (book_id,))
+            self._search_cache.clear()
             if self.cursor.rowcount > 0:
                 print(f"\n[SUCCESS] Book ID {book_id} deleted successfully.")
             else:
@@ -166,62 +530,127 @@ class LibraryDBManager:
         except sqlite3.Error as e:
             print(f"\n[ERROR] Error deleting book: {e}")
 
-    def __del__(self):
-        """Ensures the connection is closed when the object is destroyed."""
+    def close(self):
+        """Closes the writer connection and every pooled reader connection."""
+        if getattr(self, "_pool_size", 0) > 0:
+            while not self._readers.empty():
+                self._readers.get().close()
+            self._pool_size = 0
         if self.conn:
             self.conn.close()
+            self.conn = None
+        # Drop the cached instance so a later instantiation reconnects
+        self._instances.pop(self.db_name, None)
+        self._initialized = False
 
 # --- Interactive CLI Functions ---
 
+# The menu text never changes, so build it once at module load instead of
+# re-formatting it on every loop iteration.
+_MENU_TEXT = "\n".join([
+    "",
+    "=" * 40,
+    "  📚 Library Management System 📚",
+    "=" * 40,
+    "1. Add New Book",
+    "2. View All Books",
+    "3. Loan Book (Change Status to Loaned)",
+    "4. Return Book (Change Status to Available)",
+    "5. Delete Book",
+    "6. Search Book",
+    "7. Exit",
+    "-" * 40,
+])
+
 def display_menu():
     """Prints the main menu options."""
-    print("\n" + "="*40)
-    print("  📚 Library Management System 📚")
-    print("="*40)
-    print("1. Add New Book")
-    print("2. View All Books")
-    print("3. Loan Book (Change Status to Loaned)")
-    print("4. Return Book (Change Status to Available)")
-    print("5. Delete Book")
-    print("6. Search Book") # NEW OPTION
-    print("7. Exit")
-    print("-" * 40)
+    print(_MENU_TEXT)
 
 def prompt_add_book(manager):
-    """Prompts user for book details and adds it to the database."""
+    """Prompts user for book details (or a CSV file) and adds them to the database."""
     print("\n--- Add New Book ---")
+    csv_path = input("Enter a CSV file path for bulk import, or press Enter to add a single book: ").strip()
+
+    if csv_path:
+        prompt_import_csv(manager, csv_path)
+        return
+
     title = input("Enter Title: ").strip()
     author = input("Enter Author: ").strip()
     isbn = input("Enter ISBN (Unique ID): ").strip()
-    
+
     if title and author and isbn:
         manager.add_book(title, author, isbn)
     else:
         print("\n[ALERT] All fields are required. Book not added.")
 
+def prompt_import_csv(manager, csv_path):
+    """Reads 'title,author,isbn' rows from a CSV file and bulk-imports them."""
+    try:
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            rows = [tuple(field.strip() for field in row[:3])
+                    for row in csv.reader(f) if len(row) >= 3]
+    except OSError as e:
+        print(f"\n[ERROR] Could not read '{csv_path}': {e}")
+        return
+
+    # Skip a conventional 'title,author,isbn' header row, and drop rows with
+    # any blank field so they don't end up as empty-string books.
+    if rows and tuple(field.lower() for field in rows[0]) == COLUMNS:
+        rows = rows[1:]
+    rows = [row for row in rows if all(row)]
+
+    if not rows:
+        print("\n[ALERT] No valid rows found in the CSV file. Nothing imported.")
+        return
+
+    added = manager.bulk_import(rows)
+    if added is None:
+        # bulk_import already printed the error; don't report a success
+        return
+    print(f"\n[SUCCESS] Import from '{csv_path}': {added} added, {len(rows) - added} duplicates skipped.")
+
+# Row format compiled once at module load; the '.30' style precisions also
+# truncate overlong fields cheaply so columns never misalign.
+_ROW_FMT = "{:<4} | {:<30.30} | {:<20.20} | {:<15.15} | {:<10.10}"
+_TABLE_HEADER = _ROW_FMT.format("ID", "Title", "Author", "ISBN", "Status")
+_TABLE_RULE = "-" * 85
+# Rows are joined and written in chunks: one write per 500 rows instead of
+# one print per row, while keeping memory bounded for huge result sets.
+_DISPLAY_CHUNK = 500
+
 def display_books_table(books, header_title="Current Inventory"):
     """
-    Helper function to display a list of books (used by view_all and search).
+    Helper function to display books (used by view_all and search).
+    Accepts any iterable of rows and prints them as they arrive, so it works
+    with both lists and the streaming iterator without materializing rows.
     """
     print(f"\n--- {header_title} ---")
-    if not books:
-        print("[INFO] No books found matching the criteria.")
-        return
+    printed = 0
+    chunk = []
 
-    # Print Header
-    print(f"{'ID':<4} | {'Title':<30} | {'Author':<20} | {'ISBN':<15} | {'Status':<10}")
-    print("-" * 85)
-    
-    # Print Rows
     for book in books:
-        book_id, title, author, isbn, status = book
-        print(f"{book_id:<4} | {title:<30} | {author:<20} | {isbn:<15} | {status:<10}")
-    print("-" * 85)
+        if printed == 0:
+            # Print the header lazily, only once we know there is a row
+            print(_TABLE_HEADER)
+            print(_TABLE_RULE)
+        chunk.append(_ROW_FMT.format(*book))
+        printed += 1
+        if len(chunk) >= _DISPLAY_CHUNK:
+            sys.stdout.write("\n".join(chunk) + "\n")
+            chunk.clear()
+
+    if chunk:
+        sys.stdout.write("\n".join(chunk) + "\n")
+
+    if printed == 0:
+        print("[INFO] No books found matching the criteria.")
+    else:
+        print(_TABLE_RULE)
 
 def prompt_view_books(manager):
     """Displays all books in a formatted table."""
-    books = manager.view_all_books()
-    display_books_table(books)
+    display_books_table(manager.iter_all_books())
 
 # --- NEW FUNCTION: Search Book Prompt ---
 def prompt_search_book(manager):
@@ -278,6 +707,18 @@ def prompt_delete_book(manager):
             print("\n[INFO] Deletion cancelled.")
 
 
+# Maps menu choices to their handlers; a dict dispatch turns the old
+# if/elif cascade into a single hash lookup and makes new options a
+# one-line addition.
+MENU = {
+    '1': prompt_add_book,
+    '2': prompt_view_books,
+    '3': prompt_loan_book,
+    '4': prompt_return_book,
+    '5': prompt_delete_book,
+    '6': prompt_search_book,
+}
+
 # --- Main Application Loop ---
 def main():
     """Initializes the database manager and runs the main menu loop."""
@@ -287,21 +728,12 @@ def main():
         display_menu()
         choice = input("Enter your choice (1-7): ").strip()
 
-        if choice == '1':
-            prompt_add_book(manager)
-        elif choice == '2':
-            prompt_view_books(manager)
-        elif choice == '3':
-            prompt_loan_book(manager)
-        elif choice == '4':
-            prompt_return_book(manager)
-        elif choice == '5':
-            prompt_delete_book(manager)
-        elif choice == '6': # New handler for Search Book
-            prompt_search_book(manager)
+        handler = MENU.get(choice)
+        if handler is not None:
+            handler(manager)
         elif choice == '7':
             print("\n[INFO] Exiting Library Management System. Goodbye!")
-            # The __del__ method will ensure the connection is closed automatically
+            # The atexit hook closes the connections automatically
             break
         else:
             print("\n[ALERT] Invalid choice. Please enter a number between 1 and 7.")